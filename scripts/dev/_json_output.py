@@ -0,0 +1,31 @@
+"""JSON report serialization shared by the dev scripts."""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+
+def _replace_non_finite(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def dump_json_bytes(value: Any) -> bytes:
+    """Serialize a report as indented UTF-8 JSON.
+
+    NaN / infinity become null up front so the output is the same standard JSON
+    whether or not the optional orjson package is installed.
+    """
+    value = _replace_non_finite(value)
+    try:
+        import orjson
+    except ModuleNotFoundError:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2)
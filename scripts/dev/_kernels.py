@@ -0,0 +1,82 @@
+"""Optional Numba kernels for analyze-video.py.
+
+numba is not part of the base media-analysis requirements. When it is not
+installed, NUMBA_AVAILABLE is False and the analyzer keeps its numpy path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ModuleNotFoundError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+if njit is not None:
+
+    # nogil lets the analyzer's metric worker threads run kernels in parallel;
+    # the kernel itself stays single-threaded to avoid nested thread pools.
+    @njit(cache=True, nogil=True, fastmath=True)
+    def chunk_metrics_u8(
+        prev_frame: np.ndarray,
+        chunk: np.ndarray,
+        has_prev: bool,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return float32 luma and motion for a (N, P) uint8 chunk in one pass.
+
+        `prev_frame` is the flattened frame before the chunk. When `has_prev`
+        is False it is ignored and the first motion value is NaN.
+        """
+        count, pixels = chunk.shape
+        luma = np.empty(count, dtype=np.float32)
+        motion = np.empty(count, dtype=np.float32)
+        for i in range(count):
+            curr = chunk[i]
+            ref = prev_frame if i == 0 else chunk[i - 1]
+            luma_total = 0
+            diff_total = 0
+            for j in range(pixels):
+                value = np.int64(curr[j])
+                luma_total += value
+                diff_total += abs(value - np.int64(ref[j]))
+            luma[i] = luma_total / pixels
+            motion[i] = diff_total / pixels
+        if not has_prev:
+            motion[0] = np.nan
+        return luma, motion
+
+    @njit(cache=True, nogil=True, fastmath=True)
+    def chunk_luma_u8(chunk: np.ndarray) -> np.ndarray:
+        """Return float32 luma for a (N, P) uint8 chunk."""
+        count, pixels = chunk.shape
+        luma = np.empty(count, dtype=np.float32)
+        for i in range(count):
+            curr = chunk[i]
+            luma_total = 0
+            for j in range(pixels):
+                luma_total += np.int64(curr[j])
+            luma[i] = luma_total / pixels
+        return luma
+
+    @njit(cache=True, nogil=True, fastmath=True)
+    def chunk_motion_u8(
+        prev_frame: np.ndarray,
+        chunk: np.ndarray,
+        has_prev: bool,
+    ) -> np.ndarray:
+        """Return float32 motion for a (N, P) uint8 chunk; see chunk_metrics_u8."""
+        count, pixels = chunk.shape
+        motion = np.empty(count, dtype=np.float32)
+        for i in range(count):
+            curr = chunk[i]
+            ref = prev_frame if i == 0 else chunk[i - 1]
+            diff_total = 0
+            for j in range(pixels):
+                diff_total += abs(np.int64(curr[j]) - np.int64(ref[j]))
+            motion[i] = diff_total / pixels
+        if not has_prev:
+            motion[0] = np.nan
+        return motion
@@ -0,0 +1,14 @@
+"""Process-wide cache of loaded faster-whisper models for the dev scripts."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+
+@functools.lru_cache(maxsize=4)
+def get_faster_whisper_model(model_name: str, device: str, compute_type: str) -> Any:
+    """Load a WhisperModel once per (model, device, compute type) in this process."""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(model_name, device=device, compute_type=compute_type)
@@ -4,19 +4,66 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import hashlib
+import logging
 import math
 import os
+import queue
 import sys
+import threading
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from _json_output import dump_json_bytes
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    # Receives the luma and motion arrays of one decoded chunk.
+    ChunkCallback = Callable[[np.ndarray, np.ndarray], None]
+
+# Extra decode window before the tail scope when seeking (see load_metrics).
+TAIL_SEEK_MARGIN_SEC = 1.0
+# Frames are decoded into chunks of up to this many frames / bytes and reduced
+# with one numpy call per chunk.
+CHUNK_MAX_FRAMES = 64
+CHUNK_MAX_BYTES = 16 * 1024 * 1024
+METRIC_WORKER_COUNT = max(1, min(4, os.cpu_count() or 1))
+# Decoded chunks buffered between the decoder thread and the metric workers.
+CHUNK_QUEUE_SIZE = METRIC_WORKER_COUNT
+# Poll interval so blocked pipeline threads notice a failure on the other side.
+PIPELINE_POLL_SEC = 0.1
+# p05 / p50 / p95 reported by summary mode.
+SUMMARY_QUANTILES = (0.05, 0.5, 0.95)
+# Decoded metrics are cached here between runs (see load_metrics_cached).
+DEFAULT_CACHE_DIR = "~/.cache/turtle-analyzer"
+# Part of the cache key; bump whenever decoding or metric computation changes values.
+METRICS_CACHE_VERSION = 2
+# Histogram resolution for --approx quantiles over the 0-255 metric range.
+APPROX_BINS_PER_LEVEL = 64
+APPROX_BIN_COUNT = 256 * APPROX_BINS_PER_LEVEL
+
+_QUEUE_DONE = object()
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Analyze video metrics for debugging and behavior verification."
     )
-    parser.add_argument("--input", required=True, help="Path to input video file.")
+    parser.add_argument(
+        "--input",
+        nargs="+",
+        required=True,
+        help=(
+            "Path(s) to input video files. With several inputs the report is a batch "
+            "and loaded Whisper models are reused across them."
+        ),
+    )
     parser.add_argument(
         "--mode",
         default="summary",
@@ -53,7 +100,12 @@ def parse_args() -> argparse.Namespace:
         "--freeze-threshold",
         type=float,
         default=0.8,
-        help="Mean frame-diff threshold (0-255) for freeze detection. Default: 0.8",
+        help=(
+            "Mean absolute luma difference (0-255) between analyzed frames at or below "
+            "which a frame counts as frozen. Measured on gray frames after --metric-height "
+            "downscaling, which gives smaller values than full-resolution RGB diffs; "
+            "recalibrate thresholds taken from older reports. Default: 0.8"
+        ),
     )
     parser.add_argument(
         "--min-segment-frames",
@@ -61,6 +113,46 @@ def parse_args() -> argparse.Namespace:
         default=3,
         help="Minimum contiguous frames for a detected segment. Default: 3",
     )
+    parser.add_argument(
+        "--metric-height",
+        type=int,
+        default=240,
+        help=(
+            "Downscale frames to at most this height inside ffmpeg before computing "
+            "luma/motion. 0 keeps the source resolution. Default: 240"
+        ),
+    )
+    parser.add_argument(
+        "--approx",
+        action="store_true",
+        help=(
+            "Summary mode only: stream statistics in constant memory instead of keeping "
+            f"every frame's values. Percentiles are accurate to 1/{APPROX_BINS_PER_LEVEL * 2}."
+        ),
+    )
+    parser.add_argument(
+        "--sample-fps",
+        type=float,
+        default=0.0,
+        help=(
+            "Analyze only about this many frames per second; other frames are dropped "
+            "inside ffmpeg. Motion is measured between sampled frames. "
+            "Default: 0 (every frame)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=(
+            "Directory for cached per-frame metrics, keyed by file size, mtime and path. "
+            f"Not used with --approx. Default: {DEFAULT_CACHE_DIR}"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always decode the video; do not read or write the metrics cache.",
+    )
     parser.add_argument(
         "--stt-provider",
         default="auto",
@@ -85,7 +177,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--stt-compute-type",
         default="int8",
-        help="Compute type for faster-whisper. Default: int8",
+        help=(
+            "Compute type for faster-whisper. int8 is upgraded to int8_float16 when the "
+            "model runs on a CUDA GPU that supports it (int8 weights, fp16 activations). "
+            "Default: int8"
+        ),
     )
     parser.add_argument(
         "--stt-beam-size",
@@ -93,6 +189,21 @@ def parse_args() -> argparse.Namespace:
         default=5,
         help="Beam size for transcribe mode. Default: 5",
     )
+    parser.add_argument(
+        "--stt-vad",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Skip non-speech regions with faster-whisper's Silero VAD before decoding. "
+            "Ignored by openai-whisper. Default: enabled"
+        ),
+    )
+    parser.add_argument(
+        "--stt-vad-silence-ms",
+        type=int,
+        default=500,
+        help="Minimum silence (ms) that splits speech regions when --stt-vad is on. Default: 500",
+    )
     parser.add_argument(
         "--output",
         default="",
@@ -101,219 +212,809 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def compute_luma(frame: Any) -> float:
-    # Local import so --help works even when dependencies are missing.
-    import numpy as np
+@functools.cache
+def import_optional_cv2() -> Any | None:
+    # opencv-python-headless is optional; it speeds up the non-Numba path.
+    try:
+        import cv2
+    except ModuleNotFoundError:
+        return None
+    return cv2
+
+
+class FrameMetrics:
+    """Per-frame luma and motion for (N, H, W) uint8 chunks of one frame size.
+
+    Only the requested metrics are computed; the other is returned as None.
+    Scratch buffers are sized for a full chunk once and reused for every chunk,
+    so each metric worker owns one instance; instances are not thread-safe.
+    """
+
+    def __init__(
+        self,
+        chunk_shape: tuple[int, ...],
+        want_luma: bool = True,
+        want_motion: bool = True,
+    ) -> None:
+        import numpy as np
+
+        import _kernels
+
+        chunk_frames, *frame_shape = chunk_shape
+        self.want_luma = want_luma
+        self.want_motion = want_motion
+        self._pixels = math.prod(frame_shape)
+        self._diff: np.ndarray | None = None
+        self._kernels = _kernels if _kernels.NUMBA_AVAILABLE else None
+        self._cv2 = None if self._kernels is not None else import_optional_cv2()
+        if not want_motion or self._kernels is not None:
+            # The Numba kernels need no scratch.
+            return
+        if self._cv2 is not None:
+            # cv2.absdiff writes into one scratch frame.
+            self._diff = np.empty(frame_shape, dtype=np.uint8)
+        else:
+            # int16 holds the full -255..255 range, so no float copies are needed.
+            self._diff = np.empty((chunk_frames, self._pixels), dtype=np.int16)
+
+    def compute(
+        self, prev_frame: np.ndarray | None, chunk: np.ndarray
+    ) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """Return float32 luma and motion arrays for the chunk.
+
+        `prev_frame` is the frame before the chunk; motion for the chunk's first
+        frame is NaN when it is None.
+        """
+        count = len(chunk)
+        flat = chunk.reshape(count, -1)
+        if self._kernels is not None:
+            prev_flat = flat[0] if prev_frame is None else prev_frame.reshape(-1)
+            has_prev = prev_frame is not None
+            if self.want_luma and self.want_motion:
+                # One fused pass over the pixels.
+                return self._kernels.chunk_metrics_u8(prev_flat, flat, has_prev)
+            if self.want_luma:
+                return self._kernels.chunk_luma_u8(flat), None
+            return None, self._kernels.chunk_motion_u8(prev_flat, flat, has_prev)
+        luma = self._compute_luma(chunk, flat) if self.want_luma else None
+        motion = self._compute_motion(prev_frame, chunk, flat) if self.want_motion else None
+        return luma, motion
+
+    def _compute_luma(self, chunk: np.ndarray, flat: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        if self._cv2 is not None:
+            # cv2.mean returns per-channel means padded to 4 values.
+            return np.array([self._cv2.mean(frame)[0] for frame in chunk], dtype=np.float32)
+        # Accumulate uint8 pixels as integers instead of promoting frames to float.
+        return (np.add.reduce(flat, axis=1, dtype=np.uint64) / self._pixels).astype(np.float32)
+
+    def _compute_motion(
+        self, prev_frame: np.ndarray | None, chunk: np.ndarray, flat: np.ndarray
+    ) -> np.ndarray:
+        import numpy as np
+
+        count = len(chunk)
+        motion = np.empty(count, dtype=np.float32)
+        if self._cv2 is not None:
+            cv2 = self._cv2
+            for i in range(count):
+                ref = prev_frame if i == 0 else chunk[i - 1]
+                if ref is None:
+                    motion[i] = math.nan
+                    continue
+                cv2.absdiff(ref, chunk[i], dst=self._diff)
+                motion[i] = cv2.mean(self._diff)[0]
+            return motion
+
+        # Row i holds |frame i - frame i-1|; row 0 compares against prev_frame.
+        diff = self._diff[:count]
+        if prev_frame is not None:
+            np.subtract(flat[0], prev_frame.reshape(-1), out=diff[0], dtype=np.int16)
+        np.subtract(flat[1:], flat[:-1], out=diff[1:], dtype=np.int16)
+        first = 0 if prev_frame is not None else 1
+        np.abs(diff[first:], out=diff[first:])
+        motion[first:] = np.add.reduce(diff[first:], axis=1, dtype=np.int64) / self._pixels
+        if prev_frame is None:
+            motion[0] = math.nan
+        return motion
+
+
+def _drop_resize_notice(record: logging.LogRecord) -> bool:
+    # --metric-height downscales on purpose; imageio-ffmpeg warns on any size change.
+    return not record.getMessage().startswith("The frame size for reading")
+
+
+@functools.cache
+def import_imageio_ffmpeg() -> Any:
+    try:
+        import imageio_ffmpeg
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "imageio-ffmpeg was not found. Run `npm run dev:media:setup` first."
+        ) from exc
+    logging.getLogger("imageio_ffmpeg").addFilter(_drop_resize_notice)
+    return imageio_ffmpeg
+
+
+def resolve_fps(meta: dict[str, Any]) -> float:
+    fps = float(meta.get("fps") or 30.0)
+    return fps if fps > 0 else 30.0
 
-    arr = np.asarray(frame)
-    if arr.ndim == 3:
-        arr = arr[..., :3]
-    return float(arr.mean())
+
+def probe_video(video_path: Path) -> dict[str, Any]:
+    imageio_ffmpeg = import_imageio_ffmpeg()
+    # read_frames yields the stream metadata before any frame is decoded.
+    gen = imageio_ffmpeg.read_frames(str(video_path))
+    try:
+        return next(gen)
+    finally:
+        gen.close()
 
 
-def compute_frame_diff(prev_frame: Any, curr_frame: Any) -> float:
+def _iter_frames(
+    video_path: Path,
+    output_fps: float = 0.0,
+    start_sec: float = 0.0,
+    metric_height: int = 0,
+) -> Iterator[Any]:
+    """Yield the stream metadata dict first, then decoded (H, W) uint8 luma frames.
+
+    ffmpeg hands over only the full-range Y plane: a third of the bytes of
+    RGB, and the proper luma for black-frame detection. A positive
+    `output_fps` resamples the stream to that constant rate with ffmpeg's fps
+    filter, which follows timestamps (so variable-frame-rate input still maps
+    index / fps to wallclock seconds); dropped frames never reach colorspace
+    conversion or the pipe.
+    A positive `start_sec` seeks on the input side, so ffmpeg jumps to the
+    nearest keyframe and only decodes forward from there. A positive
+    `metric_height` downscales (never upscales) kept frames inside ffmpeg.
+    """
     import numpy as np
 
-    prev_arr = np.asarray(prev_frame, dtype=np.float32)
-    curr_arr = np.asarray(curr_frame, dtype=np.float32)
-    if prev_arr.ndim == 3:
-        prev_arr = prev_arr[..., :3]
-    if curr_arr.ndim == 3:
-        curr_arr = curr_arr[..., :3]
-    diff = np.abs(curr_arr - prev_arr)
-    return float(diff.mean())
-
-
-def percentile(sorted_values: list[float], p: float) -> float:
-    if not sorted_values:
-        return math.nan
-    if p <= 0:
-        return sorted_values[0]
-    if p >= 100:
-        return sorted_values[-1]
-    pos = (len(sorted_values) - 1) * (p / 100.0)
-    lo = int(math.floor(pos))
-    hi = int(math.ceil(pos))
-    if lo == hi:
-        return sorted_values[lo]
-    w = pos - lo
-    return sorted_values[lo] * (1.0 - w) + sorted_values[hi] * w
-
-
-def load_metrics(video_path: Path) -> tuple[float, list[float], list[float | None]]:
+    imageio_ffmpeg = import_imageio_ffmpeg()
+    input_params: list[str] = []
+    if start_sec > 0:
+        input_params += ["-ss", f"{start_sec:.6f}"]
+    output_params: list[str] = []
+    filters: list[str] = []
+    if output_fps > 0:
+        filters.append(f"fps={output_fps:.6f}")
+    if metric_height > 0:
+        # Area averaging preserves mean luma; bicubic can bias flat frames by +1.
+        filters.append(f"scale=-2:min(ih\\,{metric_height}):flags=area")
+    if filters:
+        output_params += ["-vf", ",".join(filters)]
+
+    gen = imageio_ffmpeg.read_frames(
+        str(video_path),
+        pix_fmt="gray",
+        bits_per_pixel=8,
+        input_params=input_params,
+        output_params=output_params,
+    )
     try:
-        import imageio.v2 as imageio
-    except ModuleNotFoundError as exc:
-        raise RuntimeError("imageio was not found. Run `npm run dev:media:setup` first.") from exc
+        meta = next(gen)
+        yield meta
+        width, height = meta["size"]
+        for raw in gen:
+            yield np.frombuffer(raw, dtype=np.uint8).reshape(height, width)
+    finally:
+        gen.close()
+
+
+def _put_until_stopped(work_queue: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            work_queue.put(item, timeout=PIPELINE_POLL_SEC)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get_until_stopped(work_queue: queue.Queue, stop: threading.Event) -> Any | None:
+    while not stop.is_set():
+        try:
+            return work_queue.get(timeout=PIPELINE_POLL_SEC)
+        except queue.Empty:
+            continue
+    return None
+
+
+def _decode_into_queue(
+    frames: Iterator[Any],
+    chunk_frames: int,
+    free_buffers: queue.Queue,
+    work_queue: queue.Queue,
+    worker_count: int,
+    stop: threading.Event,
+) -> None:
+    # Each chunk carries a copy of the frame before it, so the first motion
+    # value of a chunk does not depend on a buffer that may be reused.
+    prev_frame: Any | None = None
+    start_idx = 0
+    try:
+        while True:
+            buffer = _get_until_stopped(free_buffers, stop)
+            if buffer is None:
+                return
+            count = 0
+            for count, frame in enumerate(islice(frames, chunk_frames), start=1):
+                buffer[count - 1] = frame
+            if count == 0:
+                return
+            chunk = buffer[:count]
+            if not _put_until_stopped(work_queue, (start_idx, prev_frame, chunk, buffer), stop):
+                return
+            prev_frame = chunk[-1].copy()
+            start_idx += count
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        frames.close()
+        for _ in range(worker_count):
+            _put_until_stopped(work_queue, _QUEUE_DONE, stop)
+
+
+def _compute_queued_metrics(
+    free_buffers: queue.Queue,
+    work_queue: queue.Queue,
+    stop: threading.Event,
+    on_chunk: ChunkCallback | None,
+    on_chunk_lock: threading.Lock,
+    metrics: FrameMetrics,
+) -> list[tuple[int, int, Any, Any]]:
+    results: list[tuple[int, int, Any, Any]] = []
+    try:
+        while True:
+            item = _get_until_stopped(work_queue, stop)
+            if item is None or item is _QUEUE_DONE:
+                break
+            start_idx, prev_frame, chunk, buffer = item
+            count = len(chunk)
+            luma, motion = metrics.compute(prev_frame, chunk)
+            free_buffers.put(buffer)
+            if on_chunk is None:
+                results.append((start_idx, count, luma, motion))
+                continue
+            with on_chunk_lock:
+                on_chunk(luma, motion)
+            results.append((start_idx, count, None, None))
+    except BaseException:
+        stop.set()
+        raise
+    return results
+
+
+def get_tail_seek_index(meta: dict[str, Any], fps: float, tail_seconds: float) -> int:
+    duration = float(meta.get("duration") or 0.0)
+    if duration <= 0 or tail_seconds <= 0:
+        return 0
+    total_frames_estimate = int(round(duration * fps))
+    tail_frames = max(1, int(round(tail_seconds * fps)))
+    # Keep a margin before the tail so duration rounding cannot cut into it.
+    margin_frames = int(math.ceil(TAIL_SEEK_MARGIN_SEC * fps))
+    return max(0, total_frames_estimate - tail_frames - margin_frames)
+
 
-    reader = imageio.get_reader(str(video_path), format="ffmpeg")
+def load_metrics(
+    video_path: Path,
+    sample_fps: float = 0.0,
+    tail_seconds: float | None = None,
+    on_chunk: ChunkCallback | None = None,
+    metric_height: int = 0,
+    want_luma: bool = True,
+    want_motion: bool = True,
+) -> tuple[float, np.ndarray | None, np.ndarray | None, int]:
+    """Decode per-frame metrics as float32 arrays; motion is NaN for the first frame.
+
+    When `tail_seconds` is given, decoding starts shortly before the tail
+    window instead of at frame 0. The returned index offset is the absolute
+    frame index of the first returned value.
+
+    `metric_height` > 0 caps the decoded frame height; frame timing is unaffected.
+
+    `want_luma` / `want_motion` select the metrics to compute; the returned
+    array of a skipped metric is None.
+
+    When `on_chunk` is given, it receives each chunk's arrays (one call at a
+    time, in completion order) and nothing is retained: both returned arrays
+    are None. It is not combined with `tail_seconds`.
+    """
+    if on_chunk is not None and tail_seconds is not None:
+        raise ValueError("on_chunk cannot be combined with tail_seconds")
+    if not want_luma and not want_motion:
+        raise ValueError("at least one of want_luma / want_motion is required")
+
+    sample_every = 1
+    output_fps = 0.0
+    index_offset = 0
+    start_sec = 0.0
+    if sample_fps > 0 or tail_seconds is not None:
+        meta = probe_video(video_path)
+        source_fps = resolve_fps(meta)
+        if sample_fps > 0:
+            sample_every = max(1, int(round(source_fps / sample_fps)))
+            if sample_every > 1:
+                output_fps = source_fps / sample_every
+        if tail_seconds is not None:
+            index_offset = get_tail_seek_index(meta, source_fps / sample_every, tail_seconds)
+            start_sec = index_offset * sample_every / source_fps
+
+    import numpy as np
+
+    frames = _iter_frames(
+        video_path,
+        output_fps=output_fps,
+        start_sec=start_sec,
+        metric_height=metric_height,
+    )
     try:
-        meta = reader.get_meta_data() or {}
-        fps = float(meta.get("fps") or 30.0)
-        if fps <= 0:
-            fps = 30.0
-
-        luma_values: list[float] = []
-        motion_values: list[float | None] = []
-        prev_frame: Any | None = None
-
-        for frame in reader:
-            luma_values.append(compute_luma(frame))
-            if prev_frame is None:
-                motion_values.append(None)
-            else:
-                motion_values.append(compute_frame_diff(prev_frame, frame))
-            prev_frame = frame
+        meta = next(frames)
+        # Report the effective rate so frame indices still map to wallclock seconds.
+        fps = resolve_fps(meta) / sample_every
+        width, height = meta["size"]
+        frame_shape = (height, width)
+        chunk_frames = max(1, min(CHUNK_MAX_FRAMES, CHUNK_MAX_BYTES // math.prod(frame_shape)))
+        chunk_shape = (chunk_frames, *frame_shape)
+
+        # One decoder thread fills reusable chunk buffers and feeds a bounded queue;
+        # numpy releases the GIL in the chunk reductions, so the workers overlap
+        # with decoding and each other. Buffers go back to the pool once reduced.
+        free_buffers: queue.Queue = queue.Queue()
+        for _ in range(CHUNK_QUEUE_SIZE + METRIC_WORKER_COUNT + 1):
+            free_buffers.put(np.empty(chunk_shape, dtype=np.uint8))
+        work_queue: queue.Queue = queue.Queue(maxsize=CHUNK_QUEUE_SIZE)
+        stop = threading.Event()
+        on_chunk_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=METRIC_WORKER_COUNT + 1) as executor:
+            try:
+                decoder = executor.submit(
+                    _decode_into_queue,
+                    frames,
+                    chunk_frames,
+                    free_buffers,
+                    work_queue,
+                    METRIC_WORKER_COUNT,
+                    stop,
+                )
+                workers = [
+                    executor.submit(
+                        _compute_queued_metrics,
+                        free_buffers,
+                        work_queue,
+                        stop,
+                        on_chunk,
+                        on_chunk_lock,
+                        FrameMetrics(chunk_shape, want_luma=want_luma, want_motion=want_motion),
+                    )
+                    for _ in range(METRIC_WORKER_COUNT)
+                ]
+                decoder.result()
+                results = sorted(
+                    (row for worker in workers for row in worker.result()),
+                    key=lambda row: row[0],
+                )
+            except BaseException:
+                # Unblock the pipeline threads so the executor can shut down.
+                stop.set()
+                raise
     finally:
-        reader.close()
+        frames.close()
+
+    decoded_count = sum(count for _, count, _, _ in results)
+    if index_offset > 0 and tail_seconds is not None:
+        tail_frames = max(1, int(round(tail_seconds * fps)))
+        if decoded_count <= tail_frames:
+            # The container duration overstated the video; decode it all instead.
+            return load_metrics(
+                video_path,
+                sample_fps=sample_fps,
+                metric_height=metric_height,
+                want_luma=want_luma,
+                want_motion=want_motion,
+            )
 
-    if not luma_values:
+    if decoded_count == 0:
         raise RuntimeError("No video frames could be decoded.")
+    if on_chunk is not None:
+        return fps, None, None, index_offset
+
+    luma_values = np.concatenate([luma for _, _, luma, _ in results]) if want_luma else None
+    motion_values = np.concatenate([motion for _, _, _, motion in results]) if want_motion else None
+    return fps, luma_values, motion_values, index_offset
+
+
+def get_metrics_cache_path(
+    cache_dir: Path,
+    video_path: Path,
+    sample_fps: float,
+    metric_height: int,
+    tail_seconds: float | None,
+) -> Path:
+    stat = video_path.stat()
+    # Size and mtime invalidate entries when the recording changes; the decode
+    # options are part of the key because they change the values.
+    key = (
+        f"v{METRICS_CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}:{video_path.resolve()}"
+        f":{sample_fps}:{metric_height}:{tail_seconds}"
+    )
+    return cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.npz"
+
+
+def read_metrics_cache(cache_path: Path) -> dict[str, Any] | None:
+    import numpy as np
+
+    try:
+        with np.load(cache_path) as data:
+            entry = {name: data[name] for name in data.files}
+    except (OSError, EOFError, ValueError, zipfile.BadZipFile):
+        # Missing, empty, truncated or foreign files are misses; the entry is rewritten.
+        return None
+    if "fps" not in entry or "index_offset" not in entry:
+        return None
+    return entry
+
 
-    return fps, luma_values, motion_values
+def _unpack_metrics_cache_entry(
+    entry: dict[str, Any], want_luma: bool, want_motion: bool
+) -> tuple[float, np.ndarray | None, np.ndarray | None, int]:
+    return (
+        float(entry["fps"]),
+        entry["luma"] if want_luma else None,
+        entry["motion"] if want_motion else None,
+        int(entry["index_offset"]),
+    )
+
+
+def write_metrics_cache(cache_path: Path, entry: dict[str, Any]) -> None:
+    import numpy as np
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so concurrent runs never read a partial entry.
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as fh:
+            np.savez_compressed(fh, **entry)
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_metrics_cached(
+    video_path: Path,
+    cache_dir: Path | None,
+    sample_fps: float = 0.0,
+    tail_seconds: float | None = None,
+    metric_height: int = 0,
+    want_luma: bool = True,
+    want_motion: bool = True,
+) -> tuple[float, np.ndarray | None, np.ndarray | None, int]:
+    """`load_metrics` backed by an .npz cache in `cache_dir` (None disables it).
+
+    Entries hold the metrics earlier runs computed; only the wanted metrics an
+    entry lacks are decoded and merged into it. A full-video entry also serves
+    tail requests.
+    """
+    if cache_dir is None:
+        return load_metrics(
+            video_path,
+            sample_fps=sample_fps,
+            tail_seconds=tail_seconds,
+            metric_height=metric_height,
+            want_luma=want_luma,
+            want_motion=want_motion,
+        )
+
+    wanted = [name for name, want in (("luma", want_luma), ("motion", want_motion)) if want]
+    cache_paths = [
+        get_metrics_cache_path(cache_dir, video_path, sample_fps, metric_height, tail)
+        for tail in ([tail_seconds, None] if tail_seconds is not None else [None])
+    ]
+    entry: dict[str, Any] | None = None
+    for cache_path in cache_paths:
+        cached = read_metrics_cache(cache_path)
+        if cached is not None and all(name in cached for name in wanted):
+            return _unpack_metrics_cache_entry(cached, want_luma, want_motion)
+        if entry is None:
+            entry = cached or {}
+
+    fps, luma_values, motion_values, index_offset = load_metrics(
+        video_path,
+        sample_fps=sample_fps,
+        tail_seconds=tail_seconds,
+        metric_height=metric_height,
+        want_luma=want_luma and "luma" not in entry,
+        want_motion=want_motion and "motion" not in entry,
+    )
+    entry.update(fps=fps, index_offset=index_offset)
+    if luma_values is not None:
+        entry["luma"] = luma_values
+    if motion_values is not None:
+        entry["motion"] = motion_values
+    try:
+        write_metrics_cache(cache_paths[0], entry)
+    except OSError:
+        # The cache is an optimization; an unwritable directory must not fail the run.
+        pass
+    return _unpack_metrics_cache_entry(entry, want_luma, want_motion)
 
 
 def detect_segments(
-    values: list[float | None],
+    values: np.ndarray,
     threshold: float,
     min_frames: int,
     index_start: int,
     index_end: int,
-) -> list[dict[str, int]]:
-    segments: list[dict[str, int]] = []
-    seg_start: int | None = None
-    seg_end: int | None = None
-
-    for idx in range(index_start, index_end):
-        value = values[idx]
-        if value is not None and value <= threshold:
-            if seg_start is None:
-                seg_start = idx
-            seg_end = idx
-            continue
-
-        if seg_start is not None and seg_end is not None:
-            frame_count = seg_end - seg_start + 1
-            if frame_count >= min_frames:
-                segments.append(
-                    {
-                        "start_frame_index": seg_start,
-                        "end_frame_index": seg_end,
-                        "frame_count": frame_count,
-                    }
-                )
-            seg_start = None
-            seg_end = None
-
-    if seg_start is not None and seg_end is not None:
-        frame_count = seg_end - seg_start + 1
-        if frame_count >= min_frames:
-            segments.append(
-                {
-                    "start_frame_index": seg_start,
-                    "end_frame_index": seg_end,
-                    "frame_count": frame_count,
-                }
-            )
-
-    return segments
-
+    fps: float,
+    index_offset: int = 0,
+) -> list[dict[str, float | int]]:
+    # `values[0]` holds absolute frame `index_offset`; indices in and out are absolute.
+    import numpy as np
 
-def enrich_segments_with_time(segments: list[dict[str, int]], fps: float) -> list[dict[str, float | int]]:
-    enriched: list[dict[str, float | int]] = []
-    for seg in segments:
-        start_idx = seg["start_frame_index"]
-        end_idx = seg["end_frame_index"]
-        frame_count = seg["frame_count"]
-        enriched.append(
-            {
-                "start_frame_index": start_idx,
-                "end_frame_index": end_idx,
-                "start_time_sec": start_idx / fps,
-                "end_time_sec": end_idx / fps,
-                "frame_count": frame_count,
-                "duration_sec": frame_count / fps,
-            }
+    # NaN (no measurement) never compares <= threshold.
+    flags = values[index_start - index_offset : index_end - index_offset] <= threshold
+    # Pad with False on both sides so every run has a rising and a falling edge.
+    padded = np.zeros(len(flags) + 2, dtype=np.int8)
+    padded[1:-1] = flags
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1) + index_start
+    ends = np.flatnonzero(edges == -1) - 1 + index_start
+    lengths = ends - starts + 1
+    keep = lengths >= min_frames
+    starts, ends, lengths = starts[keep], ends[keep], lengths[keep]
+
+    return [
+        {
+            "start_frame_index": start_idx,
+            "end_frame_index": end_idx,
+            "start_time_sec": start_sec,
+            "end_time_sec": end_sec,
+            "frame_count": frame_count,
+            "duration_sec": duration_sec,
+        }
+        for start_idx, end_idx, start_sec, end_sec, frame_count, duration_sec in zip(
+            starts.tolist(),
+            ends.tolist(),
+            (starts / fps).tolist(),
+            (ends / fps).tolist(),
+            lengths.tolist(),
+            (lengths / fps).tolist(),
         )
-    return enriched
+    ]
 
 
-def get_scope_indices(total_frames: int, scope: str, tail_seconds: float, fps: float) -> tuple[int, int]:
+def get_scope_indices(
+    total_frames: int,
+    scope: str,
+    tail_seconds: float,
+    fps: float,
+    index_offset: int = 0,
+) -> tuple[int, int]:
     if total_frames <= 0:
         return 0, 0
     if scope == "full":
-        return 0, total_frames
+        return index_offset, total_frames
     if tail_seconds <= 0:
         raise ValueError("--tail-seconds must be > 0 when --scope tail")
     tail_frames = max(1, int(round(tail_seconds * fps)))
-    start = max(0, total_frames - tail_frames)
+    start = max(index_offset, total_frames - tail_frames)
     return start, total_frames
 
 
-def analyze_summary(
+class RunningStats:
+    """Streaming count / min / max / mean and quantiles for one 0-255 metric.
+
+    Quantiles come from a fixed-size histogram, so memory does not grow with
+    video length; they are accurate to half a bin. NaN values are ignored.
+    """
+
+    def __init__(self) -> None:
+        import numpy as np
+
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._hist = np.zeros(APPROX_BIN_COUNT, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        import numpy as np
+
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        count = self.count + values.size
+        # Welford-style mean update with a whole chunk at once.
+        chunk_mean = float(values.mean(dtype=np.float64))
+        self.mean += (chunk_mean - self.mean) * values.size / count
+        self.count = count
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        bins = (values * APPROX_BINS_PER_LEVEL).astype(np.int64)
+        np.clip(bins, 0, APPROX_BIN_COUNT - 1, out=bins)
+        self._hist += np.bincount(bins, minlength=APPROX_BIN_COUNT)
+
+    def summarize(self) -> dict[str, float | int]:
+        import numpy as np
+
+        if self.count == 0:
+            return summarize_values(np.empty(0, dtype=np.float32))
+        cumulative = np.cumsum(self._hist)
+
+        def value_at_rank(rank: int) -> float:
+            # Center of the bin holding the value at this 0-based rank.
+            bin_idx = int(np.searchsorted(cumulative, rank, side="right"))
+            value = (bin_idx + 0.5) / APPROX_BINS_PER_LEVEL
+            return min(max(value, self.min), self.max)
+
+        quantiles: list[float] = []
+        for q in SUMMARY_QUANTILES:
+            # Same linear interpolation between ranks as np.quantile.
+            rank = q * (self.count - 1)
+            lo = int(math.floor(rank))
+            hi = min(lo + 1, self.count - 1)
+            weight = rank - lo
+            quantiles.append(value_at_rank(lo) * (1.0 - weight) + value_at_rank(hi) * weight)
+        p05, p50, p95 = quantiles
+        return {
+            "sample_count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p05": p05,
+            "p50": p50,
+            "p95": p95,
+        }
+
+
+class SummaryAccumulator:
+    """`load_metrics` chunk callback that keeps summary-mode statistics."""
+
+    def __init__(self, black_threshold: float) -> None:
+        self.black_threshold = black_threshold
+        self.black_count = 0
+        self.luma = RunningStats()
+        self.motion = RunningStats()
+
+    def __call__(self, luma_values: np.ndarray, motion_values: np.ndarray) -> None:
+        import numpy as np
+
+        self.luma.update(luma_values)
+        self.motion.update(motion_values)
+        self.black_count += int(np.count_nonzero(luma_values <= self.black_threshold))
+
+
+def summarize_values(values: np.ndarray) -> dict[str, float | int]:
+    import numpy as np
+
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return {
+            "sample_count": 0,
+            "min": math.nan,
+            "max": math.nan,
+            "mean": math.nan,
+            "p05": math.nan,
+            "p50": math.nan,
+            "p95": math.nan,
+        }
+    # np.quantile partitions instead of sorting, so each call is O(N).
+    p05, p50, p95 = np.quantile(valid, SUMMARY_QUANTILES).tolist()
+    return {
+        "sample_count": int(valid.size),
+        "min": float(valid.min()),
+        "max": float(valid.max()),
+        "mean": float(valid.mean(dtype=np.float64)),
+        "p05": p05,
+        "p50": p50,
+        "p95": p95,
+    }
+
+
+def build_summary_report(
     video_path: Path,
     fps: float,
-    luma_values: list[float],
-    motion_values: list[float | None],
+    luma_stats: dict[str, float | int],
+    motion_stats: dict[str, float | int],
+    black_count: int,
     black_threshold: float,
+    approximate: bool,
+    sample_fps: float,
+    metric_height: int,
 ) -> dict[str, Any]:
-    total = len(luma_values)
-    sorted_luma = sorted(luma_values)
-    valid_motion = [v for v in motion_values if v is not None]
-    sorted_motion = sorted(valid_motion)
-    black_count = sum(1 for v in luma_values if v <= black_threshold)
-
+    total = int(luma_stats["sample_count"])
     return {
         "mode": "summary",
         "input_path": str(video_path),
         "fps": fps,
         "total_frames": total,
         "duration_sec_estimate": total / fps,
+        "sample_fps": sample_fps,
+        "metric_height": metric_height,
         "black_threshold": black_threshold,
-        "luma_stats": {
-            "min": min(luma_values),
-            "max": max(luma_values),
-            "mean": sum(luma_values) / total,
-            "p05": percentile(sorted_luma, 5),
-            "p50": percentile(sorted_luma, 50),
-            "p95": percentile(sorted_luma, 95),
-        },
-        "motion_stats": {
-            "sample_count": len(valid_motion),
-            "min": min(valid_motion) if valid_motion else math.nan,
-            "max": max(valid_motion) if valid_motion else math.nan,
-            "mean": (sum(valid_motion) / len(valid_motion)) if valid_motion else math.nan,
-            "p05": percentile(sorted_motion, 5) if valid_motion else math.nan,
-            "p50": percentile(sorted_motion, 50) if valid_motion else math.nan,
-            "p95": percentile(sorted_motion, 95) if valid_motion else math.nan,
-        },
+        "approximate": approximate,
+        "luma_stats": {key: value for key, value in luma_stats.items() if key != "sample_count"},
+        "motion_stats": motion_stats,
         "black_frame_count": black_count,
         "black_frame_ratio": black_count / total,
     }
 
 
+def analyze_summary(
+    video_path: Path,
+    fps: float,
+    luma_values: np.ndarray,
+    motion_values: np.ndarray,
+    black_threshold: float,
+    sample_fps: float,
+    metric_height: int,
+) -> dict[str, Any]:
+    import numpy as np
+
+    return build_summary_report(
+        video_path=video_path,
+        fps=fps,
+        luma_stats=summarize_values(luma_values),
+        motion_stats=summarize_values(motion_values),
+        black_count=int(np.count_nonzero(luma_values <= black_threshold)),
+        black_threshold=black_threshold,
+        approximate=False,
+        sample_fps=sample_fps,
+        metric_height=metric_height,
+    )
+
+
+def analyze_summary_approx(
+    video_path: Path,
+    fps: float,
+    accumulator: SummaryAccumulator,
+    sample_fps: float,
+    metric_height: int,
+) -> dict[str, Any]:
+    return build_summary_report(
+        video_path=video_path,
+        fps=fps,
+        luma_stats=accumulator.luma.summarize(),
+        motion_stats=accumulator.motion.summarize(),
+        black_count=accumulator.black_count,
+        black_threshold=accumulator.black_threshold,
+        approximate=True,
+        sample_fps=sample_fps,
+        metric_height=metric_height,
+    )
+
+
 def analyze_black_segments(
     video_path: Path,
     fps: float,
-    luma_values: list[float],
+    luma_values: np.ndarray,
     scope: str,
     tail_seconds: float,
     black_threshold: float,
     min_segment_frames: int,
+    sample_fps: float,
+    metric_height: int,
+    index_offset: int = 0,
 ) -> dict[str, Any]:
-    total = len(luma_values)
-    start, end = get_scope_indices(total, scope, tail_seconds, fps)
-    black_flags: list[float | None] = [v for v in luma_values]
-    segments_raw = detect_segments(
-        values=black_flags,
+    import numpy as np
+
+    total = index_offset + len(luma_values)
+    start, end = get_scope_indices(total, scope, tail_seconds, fps, index_offset)
+    segments = detect_segments(
+        values=luma_values,
         threshold=black_threshold,
         min_frames=min_segment_frames,
         index_start=start,
         index_end=end,
+        fps=fps,
+        index_offset=index_offset,
     )
-    segments = enrich_segments_with_time(segments_raw, fps)
     scoped_count = end - start
-    black_count = sum(1 for idx in range(start, end) if luma_values[idx] <= black_threshold)
+    scoped_luma = luma_values[start - index_offset : end - index_offset]
+    black_count = int(np.count_nonzero(scoped_luma <= black_threshold))
     last_idx = total - 1
     has_black_at_end = bool(segments and segments[-1]["end_frame_index"] >= last_idx)
 
@@ -323,6 +1024,8 @@ def analyze_black_segments(
         "fps": fps,
         "total_frames": total,
         "duration_sec_estimate": total / fps,
+        "sample_fps": sample_fps,
+        "metric_height": metric_height,
         "scope": scope,
         "tail_seconds": tail_seconds if scope == "tail" else None,
         "scope_start_frame": start,
@@ -340,30 +1043,34 @@ def analyze_black_segments(
 def analyze_freeze_segments(
     video_path: Path,
     fps: float,
-    motion_values: list[float | None],
+    motion_values: np.ndarray,
     scope: str,
     tail_seconds: float,
     freeze_threshold: float,
     min_segment_frames: int,
+    sample_fps: float,
+    metric_height: int,
+    index_offset: int = 0,
 ) -> dict[str, Any]:
-    total = len(motion_values)
-    start, end = get_scope_indices(total, scope, tail_seconds, fps)
-    # Frame 0 has no motion value.
-    start = max(start, 1)
-    segments_raw = detect_segments(
+    import numpy as np
+
+    total = index_offset + len(motion_values)
+    start, end = get_scope_indices(total, scope, tail_seconds, fps, index_offset)
+    # The first decoded frame has no motion value.
+    start = max(start, index_offset + 1)
+    segments = detect_segments(
         values=motion_values,
         threshold=freeze_threshold,
         min_frames=min_segment_frames,
         index_start=start,
         index_end=end,
+        fps=fps,
+        index_offset=index_offset,
     )
-    segments = enrich_segments_with_time(segments_raw, fps)
     scoped_count = max(0, end - start)
-    freeze_count = sum(
-        1
-        for idx in range(start, end)
-        if motion_values[idx] is not None and motion_values[idx] <= freeze_threshold
-    )
+    scoped_motion = motion_values[start - index_offset : end - index_offset]
+    # NaN (no measurement) compares False, so it is never counted as frozen.
+    freeze_count = int(np.count_nonzero(scoped_motion <= freeze_threshold))
     last_idx = total - 1
     has_freeze_at_end = bool(segments and segments[-1]["end_frame_index"] >= last_idx)
 
@@ -373,6 +1080,8 @@ def analyze_freeze_segments(
         "fps": fps,
         "total_frames": total,
         "duration_sec_estimate": total / fps,
+        "sample_fps": sample_fps,
+        "metric_height": metric_height,
         "scope": scope,
         "tail_seconds": tail_seconds if scope == "tail" else None,
         "scope_start_frame": start,
@@ -412,25 +1121,55 @@ def prepend_imageio_ffmpeg_to_path() -> None:
         os.environ["PATH"] = ffmpeg_dir + os.pathsep + path_value
 
 
+def cuda_supports_int8_float16(device: str) -> bool:
+    try:
+        import ctranslate2
+    except ModuleNotFoundError:
+        return False
+    if ctranslate2.get_cuda_device_count() == 0:
+        return False
+    # Pascal GPUs run int8 but CTranslate2 rejects int8_float16 there.
+    _, _, device_index = device.partition(":")
+    try:
+        supported = ctranslate2.get_supported_compute_types("cuda", int(device_index or 0))
+    except (RuntimeError, ValueError):
+        return False
+    return "int8_float16" in supported
+
+
+def resolve_stt_compute_type(device: str, compute_type: str) -> str:
+    # CPU int8 is already optimal; on CUDA, fp16 activations use the tensor cores.
+    if compute_type != "int8":
+        return compute_type
+    if (device == "auto" or device.startswith("cuda")) and cuda_supports_int8_float16(device):
+        return "int8_float16"
+    return compute_type
+
+
 def analyze_transcribe_faster_whisper(video_path: Path, args: argparse.Namespace) -> dict[str, Any]:
     try:
-        from faster_whisper import WhisperModel
+        import faster_whisper  # noqa: F401
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
             "faster-whisper is not installed. Run `npm run dev:media:setup -- -WithStt`."
         ) from exc
 
+    from _whisper_models import get_faster_whisper_model
+
     language = normalize_stt_language(args.stt_language)
-    model = WhisperModel(
-        args.stt_model,
-        device=args.stt_device,
-        compute_type=args.stt_compute_type,
-    )
-    segments_iter, info = model.transcribe(
-        str(video_path),
-        language=language,
-        beam_size=args.stt_beam_size,
-    )
+    compute_type = resolve_stt_compute_type(args.stt_device, args.stt_compute_type)
+    model = get_faster_whisper_model(args.stt_model, args.stt_device, compute_type)
+    transcribe_kwargs: dict[str, Any] = {
+        "language": language,
+        "beam_size": args.stt_beam_size,
+    }
+    if args.stt_vad:
+        # Beam search then only runs over the detected speech regions.
+        transcribe_kwargs["vad_filter"] = True
+        transcribe_kwargs["vad_parameters"] = {
+            "min_silence_duration_ms": args.stt_vad_silence_ms,
+        }
+    segments_iter, info = model.transcribe(str(video_path), **transcribe_kwargs)
 
     segments: list[dict[str, Any]] = []
     for idx, segment in enumerate(segments_iter):
@@ -453,6 +1192,8 @@ def analyze_transcribe_faster_whisper(video_path: Path, args: argparse.Namespace
         "provider": "faster-whisper",
         "input_path": str(video_path),
         "model": args.stt_model,
+        "compute_type": compute_type,
+        "vad_filter": args.stt_vad,
         "language": language,
         "detected_language": detected_language,
         "detected_language_probability": (
@@ -554,8 +1295,8 @@ def normalize_mode_scope(mode: str, scope: str) -> tuple[str, str]:
     return mode, scope
 
 
-def run_analysis(args: argparse.Namespace) -> dict[str, Any]:
-    input_path = Path(args.input).expanduser()
+def run_analysis(args: argparse.Namespace, input_value: str) -> dict[str, Any]:
+    input_path = Path(input_value).expanduser()
     if not input_path.exists():
         raise FileNotFoundError(f"input video not found: {input_path}")
     if args.min_segment_frames <= 0:
@@ -566,12 +1307,43 @@ def run_analysis(args: argparse.Namespace) -> dict[str, Any]:
         raise ValueError("--freeze-threshold must be >= 0")
     if args.stt_beam_size <= 0:
         raise ValueError("--stt-beam-size must be > 0")
+    if args.stt_vad_silence_ms < 0:
+        raise ValueError("--stt-vad-silence-ms must be >= 0")
+    if args.sample_fps < 0:
+        raise ValueError("--sample-fps must be >= 0")
+    if args.metric_height < 0:
+        raise ValueError("--metric-height must be >= 0")
 
     mode, scope = normalize_mode_scope(args.mode, args.scope)
     if mode == "transcribe":
         return analyze_transcribe(video_path=input_path, args=args)
+    if mode == "summary" and args.approx:
+        accumulator = SummaryAccumulator(args.black_threshold)
+        fps, _, _, _ = load_metrics(
+            input_path,
+            sample_fps=args.sample_fps,
+            on_chunk=accumulator,
+            metric_height=args.metric_height,
+        )
+        return analyze_summary_approx(
+            video_path=input_path,
+            fps=fps,
+            accumulator=accumulator,
+            sample_fps=args.sample_fps,
+            metric_height=args.metric_height,
+        )
 
-    fps, luma_values, motion_values = load_metrics(input_path)
+    # Segment modes with a tail scope only need the last few seconds decoded.
+    seek_tail = mode in {"black-segments", "freeze-segments"} and scope == "tail"
+    fps, luma_values, motion_values, index_offset = load_metrics_cached(
+        input_path,
+        cache_dir=None if args.no_cache else Path(args.cache_dir).expanduser(),
+        sample_fps=args.sample_fps,
+        tail_seconds=args.tail_seconds if seek_tail else None,
+        metric_height=args.metric_height,
+        want_luma=mode in {"summary", "black-segments"},
+        want_motion=mode in {"summary", "freeze-segments"},
+    )
 
     if mode == "summary":
         return analyze_summary(
@@ -580,6 +1352,8 @@ def run_analysis(args: argparse.Namespace) -> dict[str, Any]:
             luma_values=luma_values,
             motion_values=motion_values,
             black_threshold=args.black_threshold,
+            sample_fps=args.sample_fps,
+            metric_height=args.metric_height,
         )
     if mode == "black-segments":
         return analyze_black_segments(
@@ -590,6 +1364,9 @@ def run_analysis(args: argparse.Namespace) -> dict[str, Any]:
             tail_seconds=args.tail_seconds,
             black_threshold=args.black_threshold,
             min_segment_frames=args.min_segment_frames,
+            sample_fps=args.sample_fps,
+            metric_height=args.metric_height,
+            index_offset=index_offset,
         )
     if mode == "freeze-segments":
         return analyze_freeze_segments(
@@ -600,29 +1377,49 @@ def run_analysis(args: argparse.Namespace) -> dict[str, Any]:
             tail_seconds=args.tail_seconds,
             freeze_threshold=args.freeze_threshold,
             min_segment_frames=args.min_segment_frames,
+            sample_fps=args.sample_fps,
+            metric_height=args.metric_height,
+            index_offset=index_offset,
         )
     raise ValueError(f"unsupported mode: {mode}")
 
 
 def main() -> int:
     args = parse_args()
-    try:
-        result = run_analysis(args)
-    except Exception as exc:  # noqa: BLE001
-        print(str(exc), file=sys.stderr)
-        return 2
-
-    output_json = json.dumps(result, indent=2, ensure_ascii=False)
-    print(output_json)
+    has_error = False
+    if len(args.input) == 1:
+        try:
+            result = run_analysis(args, args.input[0])
+        except Exception as exc:  # noqa: BLE001
+            print(str(exc), file=sys.stderr)
+            return 2
+    else:
+        # A failed input must not discard the reports already produced for the others.
+        results: list[dict[str, Any]] = []
+        for input_value in args.input:
+            try:
+                results.append(run_analysis(args, input_value))
+            except Exception as exc:  # noqa: BLE001
+                has_error = True
+                results.append(
+                    {
+                        "input_path": input_value,
+                        "status": "error",
+                        "error": str(exc),
+                    }
+                )
+        result = {"mode": "batch", "results": results}
+    output_bytes = dump_json_bytes(result)
+    print(output_bytes.decode("utf-8"))
 
     if args.output:
         out_path = Path(args.output)
         if not out_path.is_absolute():
             out_path = Path.cwd() / out_path
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(output_json + "\n", encoding="utf-8")
+        out_path.write_bytes(output_bytes + b"\n")
 
-    return 0
+    return 2 if has_error else 0
 
 
 if __name__ == "__main__":
@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from _json_output import dump_json_bytes
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -38,9 +40,9 @@ def parse_args() -> argparse.Namespace:
 
 
 def prefetch_model(model_name: str, device: str, compute_type: str) -> dict[str, Any]:
-    from faster_whisper import WhisperModel
+    from _whisper_models import get_faster_whisper_model
 
-    WhisperModel(model_name, device=device, compute_type=compute_type)
+    get_faster_whisper_model(model_name, device, compute_type)
     return {
         "model": model_name,
         "status": "ok",
@@ -49,20 +51,29 @@ def prefetch_model(model_name: str, device: str, compute_type: str) -> dict[str,
 
 def main() -> int:
     args = parse_args()
-    results: list[dict[str, Any]] = []
+    results_by_model: dict[str, dict[str, Any]] = {}
     has_error = False
 
-    for model_name in args.models:
-        try:
-            result = prefetch_model(model_name, args.device, args.compute_type)
-        except Exception as exc:  # noqa: BLE001
-            has_error = True
-            result = {
-                "model": model_name,
-                "status": "error",
-                "error": str(exc),
-            }
-        results.append(result)
+    # Downloads are mostly network-bound, so prefetch the models concurrently.
+    with ThreadPoolExecutor(max_workers=min(4, len(args.models))) as executor:
+        futures = {
+            executor.submit(prefetch_model, model_name, args.device, args.compute_type): model_name
+            for model_name in dict.fromkeys(args.models)
+        }
+        for future in as_completed(futures):
+            model_name = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001
+                has_error = True
+                result = {
+                    "model": model_name,
+                    "status": "error",
+                    "error": str(exc),
+                }
+            results_by_model[model_name] = result
+
+    results = [results_by_model[model_name] for model_name in args.models]
 
     output = {
         "mode": "prefetch-whisper-models",
@@ -70,15 +81,15 @@ def main() -> int:
         "compute_type": args.compute_type,
         "results": results,
     }
-    output_json = json.dumps(output, ensure_ascii=False, indent=2)
-    print(output_json)
+    output_bytes = dump_json_bytes(output)
+    print(output_bytes.decode("utf-8"))
 
     if args.output:
         out_path = Path(args.output)
         if not out_path.is_absolute():
             out_path = Path.cwd() / out_path
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(output_json + "\n", encoding="utf-8")
+        out_path.write_bytes(output_bytes + b"\n")
 
     return 2 if has_error else 0
 
@@ -1,5 +1,5 @@
 param(
-  [string]$InputPath,
+  [string[]]$InputPath,
   [ValidateSet("summary", "black-segments", "freeze-segments", "transcribe", "tail-black", "full-black")]
   [string]$Mode = "summary",
   [ValidateSet("full", "tail")]
@@ -8,6 +8,11 @@ param(
   [double]$BlackThreshold = 8.0,
   [double]$FreezeThreshold = 0.8,
   [int]$MinSegmentFrames = 3,
+  [double]$SampleFps = 0,
+  [int]$MetricHeight = 240,
+  [switch]$Approx,
+  [string]$CacheDir = "",
+  [switch]$NoCache,
   [ValidateSet("auto", "faster-whisper", "openai-whisper")]
   [string]$SttProvider = "auto",
   [string]$SttModel = "small",
@@ -15,6 +20,8 @@ param(
   [string]$SttDevice = "auto",
   [string]$SttComputeType = "int8",
   [int]$SttBeamSize = 5,
+  [switch]$NoSttVad,
+  [int]$SttVadSilenceMs = 500,
   [string]$OutputPath = "",
   [string]$VenvDir = ".venv-media-analysis",
   [Alias("?")]
@@ -25,7 +32,7 @@ $ErrorActionPreference = "Stop"
 
 if ($Help) {
   Write-Host "Usage:"
-  Write-Host "  powershell -ExecutionPolicy Bypass -File scripts/dev/run-media-analysis.ps1 -InputPath <video> [-Mode summary|black-segments|freeze-segments|transcribe|tail-black|full-black] [-Scope full|tail] [-TailSeconds <n>] [-BlackThreshold <n>] [-FreezeThreshold <n>] [-MinSegmentFrames <n>] [-SttProvider auto|faster-whisper|openai-whisper] [-SttModel <name>] [-SttLanguage <code>] [-SttDevice <name>] [-SttComputeType <name>] [-SttBeamSize <n>] [-OutputPath <path>] [-VenvDir <path>]"
+  Write-Host "  powershell -ExecutionPolicy Bypass -File scripts/dev/run-media-analysis.ps1 -InputPath <video>[,<video>...] [-Mode summary|black-segments|freeze-segments|transcribe|tail-black|full-black] [-Scope full|tail] [-TailSeconds <n>] [-BlackThreshold <n>] [-FreezeThreshold <n>] [-MinSegmentFrames <n>] [-SampleFps <n>] [-MetricHeight <n>] [-Approx] [-CacheDir <path>] [-NoCache] [-SttProvider auto|faster-whisper|openai-whisper] [-SttModel <name>] [-SttLanguage <code>] [-SttDevice <name>] [-SttComputeType <name>] [-SttBeamSize <n>] [-NoSttVad] [-SttVadSilenceMs <n>] [-OutputPath <path>] [-VenvDir <path>]"
   Write-Host ""
   Write-Host "Example:"
   Write-Host "  npm run dev:media:analyze -- -InputPath `"C:\path\capture.mp4`" -Mode freeze-segments -Scope tail"
@@ -33,12 +40,25 @@ if ($Help) {
   exit 0
 }
 
-if ([string]::IsNullOrWhiteSpace($InputPath)) {
+# `powershell -File` (used by `npm run dev:media:analyze`) passes `a.mp4,b.mp4`
+# as one literal string, so split comma-separated inputs here.
+$InputPath = @($InputPath | ForEach-Object { $_ -split ',' } | ForEach-Object { $_.Trim() } | Where-Object { $_ })
+
+if (-not $InputPath -or ($InputPath | Where-Object { [string]::IsNullOrWhiteSpace($_) })) {
   throw "InputPath is required. Use -InputPath <video> or -Help."
 }
 if ($SttBeamSize -le 0) {
   throw "SttBeamSize must be > 0."
 }
+if ($SttVadSilenceMs -lt 0) {
+  throw "SttVadSilenceMs must be >= 0."
+}
+if ($SampleFps -lt 0) {
+  throw "SampleFps must be >= 0."
+}
+if ($MetricHeight -lt 0) {
+  throw "MetricHeight must be >= 0."
+}
 
 $RepoRoot = Resolve-Path (Join-Path $PSScriptRoot "..\..")
 $VenvPath = Join-Path $RepoRoot $VenvDir
@@ -57,25 +77,47 @@ if (-not (Test-Path $ScriptPath)) {
   throw "analyzer script was not found: $ScriptPath"
 }
 
-$ResolvedInput = Resolve-Path $InputPath -ErrorAction Stop
+$ResolvedInputs = @($InputPath | ForEach-Object { (Resolve-Path $_ -ErrorAction Stop).Path })
 
 $CliArgs = @(
   $ScriptPath,
-  "--input", $ResolvedInput.Path,
+  "--input"
+)
+$CliArgs += $ResolvedInputs
+$CliArgs += @(
   "--mode", "$Mode",
   "--scope", "$Scope",
   "--tail-seconds", "$TailSeconds",
   "--black-threshold", "$BlackThreshold",
   "--freeze-threshold", "$FreezeThreshold",
   "--min-segment-frames", "$MinSegmentFrames",
+  "--sample-fps", "$SampleFps",
+  "--metric-height", "$MetricHeight",
   "--stt-provider", "$SttProvider",
   "--stt-model", "$SttModel",
   "--stt-language", "$SttLanguage",
   "--stt-device", "$SttDevice",
   "--stt-compute-type", "$SttComputeType",
-  "--stt-beam-size", "$SttBeamSize"
+  "--stt-beam-size", "$SttBeamSize",
+  "--stt-vad-silence-ms", "$SttVadSilenceMs"
 )
 
+if ($NoSttVad) {
+  $CliArgs += "--no-stt-vad"
+}
+
+if ($Approx) {
+  $CliArgs += "--approx"
+}
+
+if (-not [string]::IsNullOrWhiteSpace($CacheDir)) {
+  $CliArgs += @("--cache-dir", $CacheDir)
+}
+
+if ($NoCache) {
+  $CliArgs += "--no-cache"
+}
+
 if (-not [string]::IsNullOrWhiteSpace($OutputPath)) {
   $CliArgs += @("--output", $OutputPath)
 }